@@ -7,15 +7,61 @@ users resolve common errors quickly.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import string
+import sys
+from dataclasses import dataclass, field
 
+_ParsedTemplate = tuple[tuple[str, str | None, str | None, str | None], ...]
 
-@dataclass
+
+def _parse_template(template: str) -> _ParsedTemplate:
+    """Pre-parse a format template into (literal, field, spec, conversion) segments."""
+    return tuple(string.Formatter().parse(template))
+
+
+@dataclass(frozen=True, slots=True)
 class FixSuggestion:
-    """A fix suggestion with a message template and optional action."""
+    """A fix suggestion with a message template and optional action.
+
+    Templates are parsed once at construction so rendering skips the
+    per-call tokenizer work done by ``str.format``.
+    """
 
     message_template: str
     action_template: str | None = None
+    _message_parsed: _ParsedTemplate = field(init=False, repr=False, compare=False)
+    _action_parsed: _ParsedTemplate | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_message_parsed", _parse_template(self.message_template))
+        object.__setattr__(
+            self,
+            "_action_parsed",
+            _parse_template(self.action_template) if self.action_template is not None else None,
+        )
+
+    def render_message(self, values: dict[str, str]) -> str | None:
+        """Render the message template, or None if a template field is missing."""
+        return _render(self._message_parsed, values)
+
+    def render_action(self, values: dict[str, str]) -> str | None:
+        """Render the action template, or None if a template field is missing."""
+        assert self._action_parsed is not None
+        return _render(self._action_parsed, values)
+
+
+def _render(parsed: _ParsedTemplate, values: dict[str, str]) -> str | None:
+    parts: list[str] = []
+    get = values.get
+    for literal, field_name, _spec, _conversion in parsed:
+        if literal:
+            parts.append(literal)
+        if field_name is not None:
+            value = get(field_name)
+            if value is None:
+                return None
+            parts.append(value)
+    return "".join(parts)
 
 
 ERROR_FIX_MAP: dict[str, FixSuggestion] = {
@@ -89,10 +135,30 @@ ERROR_FIX_MAP: dict[str, FixSuggestion] = {
     ),
 }
 
+# Interned keys let dict lookups against interned candidates hit CPython's
+# pointer-equality fast path instead of full string comparison.
+ERROR_FIX_MAP = {sys.intern(k): v for k, v in ERROR_FIX_MAP.items()}
+
 
 def get_fix_suggestion(
     error_type: str,
     _error_message: str,
     _context: dict[str, str] | None = None,
 ) -> FixSuggestion | None:
-    return ERROR_FIX_MAP.get(error_type)
+    # Interning the candidate lets the probe compare keys by pointer.
+    return ERROR_FIX_MAP.get(sys.intern(error_type))
+
+
+# Bound-method lookup for hot paths: a single C-level dict probe with no
+# Python call frame. With the interned keys above this is as fast as a
+# generated perfect-hash table for a map this small.
+get_fix_suggestion_fast = ERROR_FIX_MAP.get
+
+# Placeholder-free templates render to themselves, so their (message, action)
+# pairs are evaluated once here and served without any render call.
+STATIC_RENDERS: dict[str, tuple[str, str | None]] = {
+    error_type: (fix.message_template, fix.action_template)
+    for error_type, fix in ERROR_FIX_MAP.items()
+    if "{" not in fix.message_template
+    and (fix.action_template is None or "{" not in fix.action_template)
+}
@@ -7,6 +7,9 @@ This module provides mappings to help users install the correct package.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
+
 PACKAGE_NAME_MAP: dict[str, str] = {
     "cv2": "opencv-python",
     "sklearn": "scikit-learn",
@@ -51,6 +54,14 @@ PACKAGE_NAME_MAP: dict[str, str] = {
     "azure": "azure-core",
 }
 
+# Interned keys let dict lookups against interned candidates hit CPython's
+# pointer-equality fast path instead of full string comparison.
+PACKAGE_NAME_MAP = {sys.intern(k): v for k, v in PACKAGE_NAME_MAP.items()}
+
+# Read-only view used on the lookup path; guards against accidental writes
+# without copying the table.
+_PACKAGE_MAP = MappingProxyType(PACKAGE_NAME_MAP)
+
 
 def get_correct_package_name(import_name: str) -> str:
     """
@@ -62,5 +73,6 @@ def get_correct_package_name(import_name: str) -> str:
     Returns:
         The correct pip package name, or the import name if no mapping exists.
     """
-    base_module = import_name.split(".")[0]
-    return PACKAGE_NAME_MAP.get(base_module, import_name)
+    # partition stops at the first dot and skips the list a full split builds.
+    base_module = sys.intern(import_name.partition(".")[0])
+    return _PACKAGE_MAP.get(base_module, import_name)
@@ -4,15 +4,31 @@ Error handler for parsing Python tracebacks and providing actionable fix suggest
 
 from __future__ import annotations
 
+import bisect
+import functools
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
-from openjupy.mappings.error_fixes import ERROR_FIX_MAP, FixSuggestion
+from openjupy.mappings.error_fixes import ERROR_FIX_MAP, STATIC_RENDERS, FixSuggestion
 from openjupy.mappings.packages import get_correct_package_name
 
+try:
+    # Optional DFA engine for the most-invoked pattern; the frame pattern
+    # uses no backreferences or lookarounds, so re2 handles it natively.
+    import re2 as _frame_re  # type: ignore[import-not-found]
+except ImportError:
+    _frame_re = re
 
-@dataclass
+# Joins batch tracebacks; the NUL bytes keep it from colliding with real
+# traceback content while the newlines preserve the regexes' line anchors.
+_BATCH_DELIMITER = "\n\x00---TB---\x00\n"
+
+_GENERIC_NEXT = "Review the error and fix the underlying issue."
+
+
+@dataclass(slots=True)
 class ParsedError:
     """Parsed error information from a Python traceback."""
 
@@ -25,7 +41,7 @@ class ParsedError:
     extracted_values: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorAnalysis:
     """Complete error analysis with fix suggestions."""
 
@@ -46,17 +62,34 @@ class ErrorHandler:
     - Claude-specific tips and next steps
     """
 
-    MODULE_NOT_FOUND_PATTERN = re.compile(r"No module named ['\"]?([^'\"]+)['\"]?")
-    IMPORT_ERROR_PATTERN = re.compile(r"cannot import name ['\"]?([^'\"]+)['\"]?")
-    NAME_ERROR_PATTERN = re.compile(r"name ['\"]?([^'\"]+)['\"]? is not defined")
-    ATTRIBUTE_ERROR_PATTERN = re.compile(
-        r"['\"]?([^'\"]+)['\"]? object has no attribute ['\"]?([^'\"]+)['\"]?"
+    # Single alternation covering every error-specific extraction pattern,
+    # so one search replaces the former per-error-type regexes.
+    COMBINED_VALUE_PATTERN = re.compile(
+        r"No module named ['\"]?(?P<module>[^'\"]+)"
+        r"|cannot import name ['\"]?(?P<import_name>[^'\"]+)"
+        r"|name ['\"]?(?P<name>[^'\"]+)['\"]? is not defined"
+        r"|['\"]?(?P<type>[^'\"]+)['\"]? object has no attribute ['\"]?(?P<attribute>[^'\"]+)"
+        r"|\[Errno 2\] No such file or directory: ['\"]?(?P<path>[^'\"]+)"
     )
+    # Maps each error type to the (group name, extracted-value key) pairs it owns.
+    _COMBINED_GROUP_MAP = {
+        "ModuleNotFoundError": (("module", "module"),),
+        "ImportError": (("import_name", "name"),),
+        "NameError": (("name", "name"),),
+        "AttributeError": (("type", "type"), ("attribute", "attribute")),
+        "FileNotFoundError": (("path", "path"),),
+    }
     KEY_ERROR_PATTERN = re.compile(r"['\"]?([^'\"]+)['\"]?")
-    FILE_NOT_FOUND_PATTERN = re.compile(
-        r"\[Errno 2\] No such file or directory: ['\"]?([^'\"]+)['\"]?"
+    # Bound dict.get (not a descriptor, so no per-access binding): one
+    # C-level probe with no Python call frame on the analysis hot path.
+    _get_fix = ERROR_FIX_MAP.get
+    TRACEBACK_LINE_PATTERN = _frame_re.compile(r'File "([^"]+)", line (\d+)(?:, in ([^\n]+))?')
+    # Accepts dotted names (requests.exceptions.ConnectionError) and the
+    # non-Error builtins (SystemExit, StopIteration) alongside the usual
+    # *Error/*Warning/*Exception suffixes.
+    ERROR_LINE_PATTERN = re.compile(
+        r"(?m)^([A-Za-z_][\w.]*(?:Error|Warning|Exception|Interrupt|Exit|Iteration)): (.*)$"
     )
-    TRACEBACK_LINE_PATTERN = re.compile(r'File "([^"]+)", line (\d+)(?:, in ([^\n]+))?')
 
     def parse_traceback(self, traceback_text: str) -> ParsedError:
         """
@@ -68,33 +101,98 @@ class ErrorHandler:
         Returns:
             ParsedError with extracted information.
         """
-        lines = traceback_text.strip().split("\n")
+        error_match = self._match_final_error_line(traceback_text)
+        if error_match is None:
+            # Rare shape (trailing noise after the error line): fall back to
+            # scanning the whole text and keeping the last match.
+            error_matches = list(self.ERROR_LINE_PATTERN.finditer(traceback_text))
+            error_match = error_matches[-1] if error_matches else None
+
+        if error_match is not None:
+            error_line = (error_match.group(1), error_match.group(2))
+        else:
+            error_line = self._split_final_error_line(traceback_text)
+
+        frame_matches = list(self.TRACEBACK_LINE_PATTERN.finditer(traceback_text))
+        return self._build_parsed(
+            traceback_text,
+            error_line,
+            frame_matches[-1] if frame_matches else None,
+            len(traceback_text),
+        )
 
+    def _match_final_error_line(self, traceback_text: str) -> re.Match[str] | None:
+        """Try the error-line pattern directly on the last non-empty line.
+
+        Tracebacks end with the ``ErrorType: message`` line, so jumping there
+        with rfind keeps detection O(1) in the number of traceback lines.
+        """
+        end = len(traceback_text)
+        while end > 0 and traceback_text[end - 1] in " \t\r\n":
+            end -= 1
+        if end == 0:
+            return None
+        start = traceback_text.rfind("\n", 0, end) + 1
+        return self.ERROR_LINE_PATTERN.match(traceback_text, start)
+
+    @staticmethod
+    def _split_final_error_line(traceback_text: str) -> tuple[str, str] | None:
+        """Split the last unindented ``Type: message`` line.
+
+        Catch-all for exception classes the error-line pattern does not
+        recognize (e.g. requests.exceptions.Timeout, custom names with no
+        Error/Exception suffix). Only runs when the pattern found nothing,
+        so the anchored fast path stays untouched.
+        """
+        for line in reversed(traceback_text.strip().split("\n")):
+            if ": " in line and not line.startswith(" "):
+                error_type, _, error_message = line.partition(": ")
+                return error_type.strip(), error_message
+        return None
+
+    def _build_parsed(
+        self,
+        text: str,
+        error_line: tuple[str, str] | None,
+        frame_match: re.Match[str] | None,
+        segment_end: int,
+    ) -> ParsedError:
+        """Build a ParsedError from the final error line and deepest frame match.
+
+        ``segment_end`` bounds slicing into ``text`` so batch parsing never
+        reads past the traceback the matches belong to.
+        """
         error_type = "UnknownError"
         error_message = ""
         file_path = None
         line_number = None
         function_name = None
         code_context = None
-        extracted_values: dict[str, str] = {}
 
-        for line in reversed(lines):
-            if ": " in line and not line.startswith(" "):
-                parts = line.split(": ", 1)
-                error_type = parts[0].strip()
-                error_message = parts[1].strip() if len(parts) > 1 else ""
-                break
-
-        for i, line in enumerate(lines):
-            match = self.TRACEBACK_LINE_PATTERN.search(line)
-            if match:
-                file_path = match.group(1)
-                line_number = int(match.group(2))
-                function_name = match.group(3)
-                if i + 1 < len(lines) and lines[i + 1].startswith("    "):
-                    code_context = lines[i + 1].strip()
-
-        extracted_values = self._extract_error_values(error_type, error_message)
+        if error_line:
+            # The slice is a fresh string; interning it gives the
+            # ERROR_FIX_MAP lookups a pointer-equality fast path.
+            error_type = sys.intern(error_line[0])
+            error_message = error_line[1].strip()
+
+        if frame_match:
+            file_path = frame_match.group(1)
+            line_number = int(frame_match.group(2))
+            function_name = frame_match.group(3)
+            # The source line, if echoed, is the indented line right after the frame.
+            start = frame_match.end() + 1
+            if start < segment_end and text.startswith("    ", start):
+                end = text.find("\n", start)
+                if end == -1 or end > segment_end:
+                    end = segment_end
+                code_context = text[start:end].strip()
+
+        # Unknown error types have no templates to fill, so skip extraction
+        # entirely instead of probing the pattern tables per value.
+        if error_type in ERROR_FIX_MAP:
+            extracted_values = self._extract_error_values(error_type, error_message)
+        else:
+            extracted_values = {}
 
         return ParsedError(
             error_type=error_type,
@@ -110,38 +208,24 @@ class ErrorHandler:
         """Extract relevant values from error message based on error type."""
         values: dict[str, str] = {}
 
-        if error_type == "ModuleNotFoundError":
-            match = self.MODULE_NOT_FOUND_PATTERN.search(error_message)
-            if match:
-                module = match.group(1)
-                values["module"] = module
-                values["package"] = get_correct_package_name(module)
-
-        elif error_type == "ImportError":
-            match = self.IMPORT_ERROR_PATTERN.search(error_message)
-            if match:
-                values["name"] = match.group(1)
-
-        elif error_type == "NameError":
-            match = self.NAME_ERROR_PATTERN.search(error_message)
-            if match:
-                values["name"] = match.group(1)
-
-        elif error_type == "AttributeError":
-            match = self.ATTRIBUTE_ERROR_PATTERN.search(error_message)
-            if match:
-                values["type"] = match.group(1)
-                values["attribute"] = match.group(2)
-
-        elif error_type == "KeyError":
+        if error_type == "KeyError":
             match = self.KEY_ERROR_PATTERN.search(error_message)
             if match:
                 values["key"] = match.group(1)
+            return values
 
-        elif error_type == "FileNotFoundError":
-            match = self.FILE_NOT_FOUND_PATTERN.search(error_message)
-            if match:
-                values["path"] = match.group(1)
+        group_map = self._COMBINED_GROUP_MAP.get(error_type)
+        if group_map is None:
+            return values
+
+        match = self.COMBINED_VALUE_PATTERN.search(error_message)
+        if match:
+            for group_name, key in group_map:
+                value = match.group(group_name)
+                if value is not None:
+                    values[key] = value
+            if error_type == "ModuleNotFoundError" and "module" in values:
+                values["package"] = get_correct_package_name(values["module"])
 
         return values
 
@@ -155,12 +239,17 @@ class ErrorHandler:
         Returns:
             ErrorAnalysis with parsed error, suggestions, and Claude guidance.
         """
-        parsed = self.parse_traceback(traceback_text)
-        fix_suggestion = ERROR_FIX_MAP.get(parsed.error_type)
+        # Re-running a failing cell produces the identical traceback string;
+        # interning makes repeat cache lookups a pointer comparison.
+        return _analyze_error_cached(sys.intern(traceback_text))
+
+    def _analyze_error_uncached(self, traceback_text: str) -> ErrorAnalysis:
+        return self._build_analysis(self.parse_traceback(traceback_text))
 
-        claude_tip = self._generate_claude_tip(parsed, fix_suggestion)
-        claude_next = self._generate_claude_next(parsed, fix_suggestion)
-        suggested_action = self._generate_action(parsed, fix_suggestion)
+    def _build_analysis(self, parsed: ParsedError) -> ErrorAnalysis:
+        fix_suggestion = self._get_fix(parsed.error_type)
+
+        claude_tip, claude_next, suggested_action = self._render_guidance(parsed, fix_suggestion)
 
         return ErrorAnalysis(
             parsed_error=parsed,
@@ -170,56 +259,105 @@ class ErrorHandler:
             suggested_action=suggested_action,
         )
 
-    def _generate_claude_tip(self, parsed: ParsedError, fix: FixSuggestion | None) -> str:
-        """Generate a Claude-specific tip explaining the error."""
-        if fix and fix.message_template:
-            try:
-                return fix.message_template.format(**parsed.extracted_values)
-            except KeyError:
-                pass
-
-        location = ""
-        if parsed.file_path and parsed.line_number:
-            location = f" at {parsed.file_path}:{parsed.line_number}"
-
-        return f"{parsed.error_type}{location}: {parsed.error_message}"
+    def analyze_batch(self, tracebacks: list[str]) -> list[ErrorAnalysis]:
+        """
+        Analyze several tracebacks with a single scan per regex.
 
-    def _generate_claude_next(self, parsed: ParsedError, fix: FixSuggestion | None) -> str:
-        """Generate a suggestion for what Claude should do next."""
-        if parsed.error_type == "ModuleNotFoundError":
-            package = parsed.extracted_values.get("package", "")
-            if package:
-                return f"Install the missing package using: uv add {package}"
-            return "Install the missing module using uv or pip."
+        The tracebacks are joined into one buffer so each pattern runs once
+        over all of them, and the matches are demultiplexed back to their
+        traceback by span position. This amortizes regex dispatch and match
+        allocation when re-running a notebook with many failed cells.
 
-        if parsed.error_type == "NameError":
-            name = parsed.extracted_values.get("name", "")
-            return f"Define '{name}' before using it, or check for typos."
+        Args:
+            tracebacks: Traceback texts, one per failed execution.
 
-        if parsed.error_type == "FileNotFoundError":
-            return "Verify the file path. Use os.getcwd() to check current directory."
+        Returns:
+            One ErrorAnalysis per traceback, in input order.
+        """
+        if not tracebacks:
+            return []
+
+        joined = _BATCH_DELIMITER.join(tracebacks)
+
+        starts: list[int] = [0]
+        for traceback_text in tracebacks[:-1]:
+            starts.append(starts[-1] + len(traceback_text) + len(_BATCH_DELIMITER))
+
+        count = len(tracebacks)
+        error_matches: list[re.Match[str] | None] = [None] * count
+        for match in self.ERROR_LINE_PATTERN.finditer(joined):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            error_matches[index] = match
+
+        frame_matches: list[re.Match[str] | None] = [None] * count
+        for match in self.TRACEBACK_LINE_PATTERN.finditer(joined):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            frame_matches[index] = match
+
+        analyses: list[ErrorAnalysis] = []
+        for index in range(count):
+            segment_end = starts[index] + len(tracebacks[index])
+            error_match = error_matches[index]
+            if error_match is not None:
+                error_line = (error_match.group(1), error_match.group(2))
+            else:
+                error_line = self._split_final_error_line(joined[starts[index] : segment_end])
+            analyses.append(
+                self._build_analysis(
+                    self._build_parsed(joined, error_line, frame_matches[index], segment_end)
+                )
+            )
+        return analyses
+
+    def _render_guidance(
+        self, parsed: ParsedError, fix: FixSuggestion | None
+    ) -> tuple[str, str, str | None]:
+        """Render (claude_tip, claude_next, suggested_action) in a single pass.
+
+        The three outputs share the error-type dispatch, the extracted-value
+        lookups, and the action render, so producing them together avoids
+        repeating that work per field.
+        """
+        error_type = parsed.error_type
+        values = parsed.extracted_values
 
-        if fix and fix.action_template:
-            try:
-                return fix.action_template.format(**parsed.extracted_values)
-            except KeyError:
-                return fix.action_template
+        static = STATIC_RENDERS.get(error_type)
+        if static is not None:
+            message, action = static
+            next_step = action if action is not None else _GENERIC_NEXT
+            return message, next_step, action
 
-        return "Review the error and fix the underlying issue."
+        tip = None
+        if fix and fix.message_template:
+            tip = fix.render_message(values)
+        if tip is None:
+            location = ""
+            if parsed.file_path and parsed.line_number:
+                location = f" at {parsed.file_path}:{parsed.line_number}"
+            tip = f"{error_type}{location}: {parsed.error_message}"
 
-    def _generate_action(self, parsed: ParsedError, fix: FixSuggestion | None) -> str | None:
-        if parsed.error_type == "ModuleNotFoundError":
-            package = parsed.extracted_values.get("package")
+        if error_type == "ModuleNotFoundError":
+            package = values.get("package")
             if package:
-                return f"uv add {package}"
+                action = f"uv add {package}"
+                return tip, f"Install the missing package using: {action}", action
+            next_step = "Install the missing module using uv or pip."
+        elif error_type == "NameError":
+            next_step = f"Define '{values.get('name', '')}' before using it, or check for typos."
+        elif error_type == "FileNotFoundError":
+            next_step = "Verify the file path. Use os.getcwd() to check current directory."
+        else:
+            next_step = ""
 
-        if fix and fix.action_template:
-            try:
-                return fix.action_template.format(**parsed.extracted_values)
-            except KeyError:
-                return None
+        action = fix.render_action(values) if fix and fix.action_template else None
 
-        return None
+        if not next_step:
+            if fix and fix.action_template:
+                next_step = action if action is not None else fix.action_template
+            else:
+                next_step = _GENERIC_NEXT
+
+        return tip, next_step, action
 
     def enrich_response(self, response: dict[str, Any], traceback_text: str) -> dict[str, Any]:
         """
@@ -233,20 +371,32 @@ class ErrorHandler:
             Enriched response with claude_tip, claude_next, and fix suggestions.
         """
         analysis = self.analyze_error(traceback_text)
+        parsed = analysis.parsed_error
 
-        enriched = dict(response)
-        enriched["claude_tip"] = analysis.claude_tip
-        enriched["claude_next"] = analysis.claude_next
-
-        if analysis.suggested_action:
-            enriched["suggested_action"] = analysis.suggested_action
+        action = (
+            {"suggested_action": analysis.suggested_action} if analysis.suggested_action else {}
+        )
 
-        enriched["error_details"] = {
-            "type": analysis.parsed_error.error_type,
-            "message": analysis.parsed_error.error_message,
-            "file": analysis.parsed_error.file_path,
-            "line": analysis.parsed_error.line_number,
-            "function": analysis.parsed_error.function_name,
+        return {
+            **response,
+            "claude_tip": analysis.claude_tip,
+            "claude_next": analysis.claude_next,
+            **action,
+            "error_details": {
+                "type": parsed.error_type,
+                "message": parsed.error_message,
+                "file": parsed.file_path,
+                "line": parsed.line_number,
+                "function": parsed.function_name,
+            },
         }
 
-        return enriched
+
+# ErrorHandler is stateless, so analyses can be shared across instances;
+# the cached ErrorAnalysis is treated as immutable by all callers.
+_SHARED_HANDLER = ErrorHandler()
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_error_cached(traceback_text: str) -> ErrorAnalysis:
+    return _SHARED_HANDLER._analyze_error_uncached(traceback_text)
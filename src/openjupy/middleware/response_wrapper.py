@@ -4,13 +4,45 @@ Response wrapper for enriching Jupyter tool responses with Claude guidance.
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from typing import Any
 
 from openjupy.middleware.error_handler import ErrorHandler
 
+# Constant response fragments, built once so the wrappers only fill in the
+# dynamic parts per call.
+_KERNEL_STOPPED = {
+    "status": "stopped",
+    "claude_tip": "Kernel is not running.",
+    "claude_next": "Start the kernel or create a new notebook.",
+}
+_KERNEL_RUNNING_NEXT = "Execute code with jupyter_execute_cell()."
+_CODE_CELL_NEXT = "Execute the cell with jupyter_execute_cell()."
+_MARKDOWN_CELL_NEXT = "Add more cells or execute existing code cells."
+_NOTEBOOK_CREATED_NEXT = (
+    "Add cells with jupyter_add_cell() or execute code with jupyter_execute_cell()."
+)
 
-@dataclass
+
+# Only this many DataFrame names are listed in the tip; collecting more
+# would bloat the message without helping.
+_MAX_DF_VARS = 16
+
+
+def _find_dataframe_vars(namespace_vars: list[str]) -> list[str]:
+    """Filter namespace names that look like DataFrames (``df`` or ``*_df``).
+
+    Collects one past the display cap so callers can tell truncation
+    happened without the generator ever materializing a huge list.
+    """
+    # Unbound method as a local: skips creating a bound method per name.
+    ends = str.endswith
+    matches = (v for v in namespace_vars if ends(v, "_df") or v == "df")
+    return list(itertools.islice(matches, _MAX_DF_VARS + 1))
+
+
+@dataclass(slots=True)
 class NamespaceInfo:
     """Information about the current Jupyter namespace."""
 
@@ -48,35 +80,29 @@ class ResponseWrapper:
         Returns:
             Enriched response with claude_tip and claude_next.
         """
-        enriched = dict(response)
-        enriched["status"] = "success"
-
-        tips: list[str] = []
-        next_steps: list[str] = []
-
         if output:
-            tips.append("Code executed successfully with output.")
+            claude_tip = "Code executed successfully with output."
         else:
-            tips.append("Code executed successfully (no output).")
+            claude_tip = "Code executed successfully (no output)."
+        claude_next = ""
 
         if namespace_vars:
-            df_vars = [v for v in namespace_vars if v.endswith("_df") or v == "df"]
+            df_vars = _find_dataframe_vars(namespace_vars)
             if df_vars:
-                tips.append(f"DataFrames available: {', '.join(df_vars)}")
-                next_steps.append(
-                    f"Explore data with {df_vars[0]}.head() or {df_vars[0]}.describe()"
-                )
-
-            if len(namespace_vars) > 0:
-                tips.append(f"Namespace contains {len(namespace_vars)} variable(s).")
-                next_steps.append("Use jupyter_inspect_namespace() to see all defined variables.")
-
-        enriched["claude_tip"] = " ".join(tips) if tips else "Execution complete."
-        enriched["claude_next"] = (
-            " ".join(next_steps) if next_steps else "Continue with your analysis."
-        )
-
-        return enriched
+                listing = ", ".join(df_vars[:_MAX_DF_VARS])
+                if len(df_vars) > _MAX_DF_VARS:
+                    listing += ", …"
+                claude_tip += f" DataFrames available: {listing}"
+                claude_next = f"Explore data with {df_vars[0]}.head() or {df_vars[0]}.describe() "
+            claude_tip += f" Namespace contains {len(namespace_vars)} variable(s)."
+            claude_next += "Use jupyter_inspect_namespace() to see all defined variables."
+
+        return {
+            **response,
+            "status": "success",
+            "claude_tip": claude_tip,
+            "claude_next": claude_next if claude_next else "Continue with your analysis.",
+        }
 
     def wrap_execution_error(
         self,
@@ -93,10 +119,9 @@ class ResponseWrapper:
         Returns:
             Enriched response with error analysis and fix suggestions.
         """
-        enriched = dict(response)
-        enriched["status"] = "error"
-
-        return self.error_handler.enrich_response(enriched, traceback_text)
+        return self.error_handler.enrich_response(
+            {**response, "status": "error"}, traceback_text
+        )
 
     def wrap_notebook_created(
         self,
@@ -115,18 +140,16 @@ class ResponseWrapper:
         Returns:
             Enriched response with next steps.
         """
-        enriched = dict(response)
-        enriched["status"] = "success"
-        enriched["claude_tip"] = f"Notebook created at {notebook_path}."
-
+        claude_tip = f"Notebook created at {notebook_path}."
         if kernel_name:
-            enriched["claude_tip"] += f" Using kernel: {kernel_name}."
-
-        enriched["claude_next"] = (
-            "Add cells with jupyter_add_cell() or execute code with jupyter_execute_cell()."
-        )
+            claude_tip += f" Using kernel: {kernel_name}."
 
-        return enriched
+        return {
+            **response,
+            "status": "success",
+            "claude_tip": claude_tip,
+            "claude_next": _NOTEBOOK_CREATED_NEXT,
+        }
 
     def wrap_cell_added(
         self,
@@ -145,16 +168,12 @@ class ResponseWrapper:
         Returns:
             Enriched response with next steps.
         """
-        enriched = dict(response)
-        enriched["status"] = "success"
-        enriched["claude_tip"] = f"{cell_type.capitalize()} cell added at index {cell_index}."
-
-        if cell_type == "code":
-            enriched["claude_next"] = "Execute the cell with jupyter_execute_cell()."
-        else:
-            enriched["claude_next"] = "Add more cells or execute existing code cells."
-
-        return enriched
+        return {
+            **response,
+            "status": "success",
+            "claude_tip": f"{cell_type.capitalize()} cell added at index {cell_index}.",
+            "claude_next": _CODE_CELL_NEXT if cell_type == "code" else _MARKDOWN_CELL_NEXT,
+        }
 
     def wrap_kernel_status(
         self,
@@ -173,20 +192,18 @@ class ResponseWrapper:
         Returns:
             Enriched response with status info.
         """
-        enriched = dict(response)
-
         if is_alive:
-            enriched["status"] = "running"
-            enriched["claude_tip"] = "Kernel is running and ready for execution."
+            claude_tip = "Kernel is running and ready for execution."
             if execution_count is not None:
-                enriched["claude_tip"] += f" Execution count: {execution_count}."
-            enriched["claude_next"] = "Execute code with jupyter_execute_cell()."
-        else:
-            enriched["status"] = "stopped"
-            enriched["claude_tip"] = "Kernel is not running."
-            enriched["claude_next"] = "Start the kernel or create a new notebook."
+                claude_tip += f" Execution count: {execution_count}."
+            return {
+                **response,
+                "status": "running",
+                "claude_tip": claude_tip,
+                "claude_next": _KERNEL_RUNNING_NEXT,
+            }
 
-        return enriched
+        return {**response, **_KERNEL_STOPPED}
 
     def wrap_generic_success(
         self,
@@ -205,13 +222,13 @@ class ResponseWrapper:
         Returns:
             Enriched response.
         """
-        enriched = dict(response)
-        enriched["status"] = "success"
-        enriched["claude_tip"] = f"{operation} completed successfully."
-
+        claude_tip = f"{operation} completed successfully."
         if details:
-            enriched["claude_tip"] += f" {details}"
-
-        enriched["claude_next"] = "Continue with your workflow."
-
-        return enriched
+            claude_tip += f" {details}"
+
+        return {
+            **response,
+            "status": "success",
+            "claude_tip": claude_tip,
+            "claude_next": "Continue with your workflow.",
+        }
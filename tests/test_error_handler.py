@@ -90,6 +90,54 @@ ImportError: cannot import name 'nonexistent' from 'sklearn'"""
         assert result.file_path is None
         assert result.line_number is None
 
+    def test_parse_dotted_exception_name(self) -> None:
+        traceback = """Traceback (most recent call last):
+  File "j.py", line 5, in fetch
+    response = requests.get(url)
+requests.exceptions.ConnectionError: boom"""
+
+        result = self.handler.parse_traceback(traceback)
+
+        assert result.error_type == "requests.exceptions.ConnectionError"
+        assert result.error_message == "boom"
+        assert result.file_path == "j.py"
+        assert result.line_number == 5
+
+    def test_parse_unrecognized_exception_suffix(self) -> None:
+        traceback = """Traceback (most recent call last):
+  File "fetch.py", line 8, in fetch
+    response = requests.get(url, timeout=1)
+requests.exceptions.Timeout: request timed out"""
+
+        result = self.handler.parse_traceback(traceback)
+
+        assert result.error_type == "requests.exceptions.Timeout"
+        assert result.error_message == "request timed out"
+        assert result.file_path == "fetch.py"
+        assert result.line_number == 8
+
+    def test_parse_custom_exception_name(self) -> None:
+        traceback = """Traceback (most recent call last):
+  File "check.py", line 12, in validate
+    raise ValidationFailure("bad input")
+ValidationFailure: bad input"""
+
+        result = self.handler.parse_traceback(traceback)
+
+        assert result.error_type == "ValidationFailure"
+        assert result.error_message == "bad input"
+
+    def test_parse_system_exit(self) -> None:
+        traceback = """Traceback (most recent call last):
+  File "run.py", line 3, in <module>
+    sys.exit(1)
+SystemExit: 1"""
+
+        result = self.handler.parse_traceback(traceback)
+
+        assert result.error_type == "SystemExit"
+        assert result.error_message == "1"
+
 
 class TestAnalyzeError:
     def setup_method(self) -> None:
@@ -139,6 +187,52 @@ FileNotFoundError: [Errno 2] No such file or directory: 'missing.txt'"""
         assert result.claude_next is not None
 
 
+class TestAnalyzeBatch:
+    def setup_method(self) -> None:
+        self.handler = ErrorHandler()
+
+    def test_batch_matches_individual_analysis(self) -> None:
+        tracebacks = [
+            """Traceback (most recent call last):
+  File "test.py", line 1, in <module>
+    import cv2
+ModuleNotFoundError: No module named 'cv2'""",
+            """Traceback (most recent call last):
+  File "script.py", line 10, in main
+    print(undefined_var)
+NameError: name 'undefined_var' is not defined""",
+            "CustomError: something went wrong",
+            "requests.exceptions.Timeout: request timed out",
+        ]
+
+        batch = self.handler.analyze_batch(tracebacks)
+
+        assert len(batch) == 4
+        for traceback, analysis in zip(tracebacks, batch, strict=True):
+            single = self.handler.analyze_error(traceback)
+            assert analysis.parsed_error == single.parsed_error
+            assert analysis.claude_tip == single.claude_tip
+            assert analysis.claude_next == single.claude_next
+            assert analysis.suggested_action == single.suggested_action
+
+    def test_batch_preserves_code_context_boundaries(self) -> None:
+        tracebacks = [
+            """Traceback (most recent call last):
+  File "a.py", line 2, in <module>
+    import cv2
+ModuleNotFoundError: No module named 'cv2'""",
+            "ValueError: invalid literal",
+        ]
+
+        batch = self.handler.analyze_batch(tracebacks)
+
+        assert batch[0].parsed_error.code_context == "import cv2"
+        assert batch[1].parsed_error.file_path is None
+
+    def test_empty_batch(self) -> None:
+        assert self.handler.analyze_batch([]) == []
+
+
 class TestEnrichResponse:
     def setup_method(self) -> None:
         self.handler = ErrorHandler()
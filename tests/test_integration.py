@@ -2,8 +2,9 @@ from openjupy.middleware.response_wrapper import ResponseWrapper
 
 
 class TestMultimodalOutputHandling:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_success_with_image_output(self) -> None:
         response = {
@@ -48,8 +49,9 @@ ZeroDivisionError: division by zero"""
 
 
 class TestJupyterWorkflowSimulation:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_notebook_creation_to_execution_flow(self) -> None:
         create_response = self.wrapper.wrap_notebook_created(
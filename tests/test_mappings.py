@@ -1,4 +1,9 @@
-from openjupy.mappings.error_fixes import ERROR_FIX_MAP, FixSuggestion, get_fix_suggestion
+from openjupy.mappings.error_fixes import (
+    ERROR_FIX_MAP,
+    FixSuggestion,
+    get_fix_suggestion,
+    get_fix_suggestion_fast,
+)
 from openjupy.mappings.packages import PACKAGE_NAME_MAP, get_correct_package_name
 
 
@@ -100,3 +105,7 @@ class TestGetFixSuggestion:
     def test_ignores_context_parameter(self) -> None:
         fix = get_fix_suggestion("ValueError", "bad value", _context={"key": "value"})
         assert fix is not None
+
+    def test_fast_lookup_matches_map(self) -> None:
+        assert get_fix_suggestion_fast("ValueError") is ERROR_FIX_MAP["ValueError"]
+        assert get_fix_suggestion_fast("CustomError") is None
@@ -2,8 +2,9 @@ from openjupy.middleware.response_wrapper import ResponseWrapper
 
 
 class TestWrapExecutionSuccess:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_success_with_output(self) -> None:
         response = {"result": "data"}
@@ -30,7 +31,7 @@ class TestWrapExecutionSuccess:
 
         assert "DataFrames available" in result["claude_tip"]
         assert "df" in result["claude_tip"]
-        assert ".head()" in result["claude_next"] or ".describe()" in result["claude_next"]
+        assert any(tok in result["claude_next"] for tok in (".head()", ".describe()"))
 
     def test_success_with_namespace_vars(self) -> None:
         response = {}
@@ -50,8 +51,9 @@ class TestWrapExecutionSuccess:
 
 
 class TestWrapExecutionError:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_error_sets_status(self) -> None:
         response = {}
@@ -82,8 +84,9 @@ ModuleNotFoundError: No module named 'pandas'"""
 
 
 class TestWrapNotebookCreated:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_notebook_created_basic(self) -> None:
         response = {}
@@ -93,9 +96,8 @@ class TestWrapNotebookCreated:
 
         assert result["status"] == "success"
         assert "/path/to/notebook.ipynb" in result["claude_tip"]
-        assert (
-            "jupyter_add_cell" in result["claude_next"]
-            or "jupyter_execute_cell" in result["claude_next"]
+        assert any(
+            tok in result["claude_next"] for tok in ("jupyter_add_cell", "jupyter_execute_cell")
         )
 
     def test_notebook_created_with_kernel(self) -> None:
@@ -108,8 +110,9 @@ class TestWrapNotebookCreated:
 
 
 class TestWrapCellAdded:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_code_cell_added(self) -> None:
         response = {}
@@ -129,8 +132,9 @@ class TestWrapCellAdded:
 
 
 class TestWrapKernelStatus:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_kernel_running(self) -> None:
         response = {}
@@ -154,8 +158,9 @@ class TestWrapKernelStatus:
 
 
 class TestWrapGenericSuccess:
-    def setup_method(self) -> None:
-        self.wrapper = ResponseWrapper()
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.wrapper = ResponseWrapper()
 
     def test_generic_success_basic(self) -> None:
         response = {}
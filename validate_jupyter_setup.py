@@ -6,14 +6,34 @@ Checks that all required dependencies and configurations are in place
 for the jupyter-mcp-server integration to work correctly.
 """
 
+import importlib.metadata
+import json
 import os
+import re
 import subprocess
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from typing import Optional
 
+# Plain-dict snapshot: os.environ is a proxy that re-encodes on every
+# access, and the checks only care about the environment at startup.
+_ENV_SNAPSHOT = dict(os.environ)
 
-@dataclass
+# Pre-colored status prefixes and rules, built once instead of per line.
+_PASS = "\033[92m[PASS]\033[0m"
+_FAIL = "\033[91m[FAIL]\033[0m"
+_SEP = "=" * 60
+_MINOR = "-" * 60
+
+# One server URL per line in `jupyter lab list` output.
+_JUPYTER_URL_RE = re.compile(r"https?://\S+")
+
+
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     """Result of a validation check."""
 
@@ -42,28 +62,18 @@ def check_package_installed(
 ) -> CheckResult:
     """Check if a Python package is installed with optional version check."""
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "show", package],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return CheckResult(
-                name=package,
-                passed=False,
-                message="Not installed",
-                fix_hint=f"pip install {package}"
-                + (f"=={min_version}" if min_version else ""),
-            )
-
-        # Extract version from pip show output
-        version_line = [
-            line for line in result.stdout.split("\n") if line.startswith("Version:")
-        ]
-        version = version_line[0].split(": ")[1] if version_line else "unknown"
-
+        # In-process metadata lookup; spawning `pip show` costs hundreds of
+        # milliseconds of interpreter and resolver startup per package.
+        version = importlib.metadata.version(package)
         return CheckResult(name=package, passed=True, message=f"v{version}")
+    except importlib.metadata.PackageNotFoundError:
+        return CheckResult(
+            name=package,
+            passed=False,
+            message="Not installed",
+            fix_hint=f"pip install {package}"
+            + (f"=={min_version}" if min_version else ""),
+        )
     except Exception as e:
         return CheckResult(
             name=package,
@@ -99,18 +109,53 @@ def check_uv_installed() -> CheckResult:
 
 def check_jupyter_running() -> CheckResult:
     """Check if JupyterLab is running."""
+    # Running servers drop a jpserver-*.json file into the Jupyter runtime
+    # dir; reading those is milliseconds versus spawning the full jupyter
+    # CLI. The subprocess path remains as fallback when the dir is absent.
+    runtime_dir = Path(
+        os.environ.get("JUPYTER_RUNTIME_DIR")
+        or Path.home() / ".local" / "share" / "jupyter" / "runtime"
+    )
+    try:
+        if runtime_dir.is_dir():
+            servers = 0
+            for server_file in runtime_dir.glob("jpserver-*.json"):
+                try:
+                    json.loads(server_file.read_text())
+                except (OSError, json.JSONDecodeError):
+                    continue
+                servers += 1
+            if servers:
+                return CheckResult(
+                    name="JupyterLab Server",
+                    passed=True,
+                    message=f"Running ({servers} server(s))",
+                )
+            return CheckResult(
+                name="JupyterLab Server",
+                passed=False,
+                message="Not running",
+                fix_hint="jupyter lab --port 8888 --IdentityProvider.token YOUR_TOKEN",
+            )
+    except OSError:
+        pass
+    return _check_jupyter_running_subprocess()
+
+
+def _check_jupyter_running_subprocess() -> CheckResult:
+    """Fallback check via the jupyter CLI when the runtime dir is unusable."""
     try:
         result = subprocess.run(
             ["jupyter", "lab", "list"], capture_output=True, text=True, check=False
         )
-        if result.returncode == 0 and "http" in result.stdout:
-            # Extract running servers
-            lines = [l for l in result.stdout.split("\n") if "http" in l]
-            if lines:
+        if result.returncode == 0:
+            # Extract running servers in one compiled-regex pass
+            urls = _JUPYTER_URL_RE.findall(result.stdout)
+            if urls:
                 return CheckResult(
                     name="JupyterLab Server",
                     passed=True,
-                    message=f"Running ({len(lines)} server(s))",
+                    message=f"Running ({len(urls)} server(s))",
                 )
         return CheckResult(
             name="JupyterLab Server",
@@ -129,10 +174,10 @@ def check_jupyter_running() -> CheckResult:
 
 def check_env_var(var_name: str) -> CheckResult:
     """Check if an environment variable is set."""
-    value = os.environ.get(var_name)
+    value = _ENV_SNAPSHOT.get(var_name)
     if value:
         # Mask the value for security
-        masked = value[:4] + "..." + value[-4:] if len(value) > 8 else "****"
+        masked = f"{value[:4]}...{value[-4:]}" if len(value) > 8 else "****"
         return CheckResult(name=f"${var_name}", passed=True, message=f"Set ({masked})")
     return CheckResult(
         name=f"${var_name}",
@@ -152,16 +197,26 @@ def check_kernelspec() -> CheckResult:
             check=False,
         )
         if result.returncode == 0:
-            kernels = [
-                l.strip().split()[0]
-                for l in result.stdout.split("\n")
-                if l.strip() and not l.startswith("Available")
-            ]
-            if "python3" in kernels or any("python" in k.lower() for k in kernels):
+            # One pass over the listing: grab the first three kernel names
+            # for the message and flag any python kernel along the way.
+            found_python = False
+            first_kernels: list[str] = []
+            for line in result.stdout.splitlines():
+                stripped = line.strip()
+                if not stripped or stripped.startswith("Available"):
+                    continue
+                name = stripped.partition(" ")[0]
+                if len(first_kernels) < 3:
+                    first_kernels.append(name)
+                if name == "python3" or "python" in name.lower():
+                    found_python = True
+                    if len(first_kernels) == 3:
+                        break
+            if found_python:
                 return CheckResult(
                     name="Python Kernel",
                     passed=True,
-                    message=f"Found: {', '.join(kernels[:3])}",
+                    message=f"Found: {', '.join(first_kernels)}",
                 )
         return CheckResult(
             name="Python Kernel",
@@ -180,41 +235,31 @@ def check_kernelspec() -> CheckResult:
 
 def print_results(results: list[CheckResult]) -> bool:
     """Print validation results and return overall status."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("OpenCode Jupyter Integration - Validation Results")
-    print("=" * 60 + "\n")
+    print(_SEP + "\n")
 
     all_passed = True
     for result in results:
-        status = "[PASS]" if result.passed else "[FAIL]"
-        color = "\033[92m" if result.passed else "\033[91m"
-        reset = "\033[0m"
-
-        print(f"{color}{status}{reset} {result.name}: {result.message}")
+        print(f"{_PASS if result.passed else _FAIL} {result.name}: {result.message}")
         if result.fix_hint:
             print(f"       Fix: {result.fix_hint}")
 
         if not result.passed:
             all_passed = False
 
-    print("\n" + "-" * 60)
+    print("\n" + _MINOR)
     if all_passed:
         print("\033[92mAll checks passed! Your setup is ready.\033[0m")
     else:
         print("\033[91mSome checks failed. Please fix the issues above.\033[0m")
-    print("-" * 60 + "\n")
+    print(_MINOR + "\n")
 
     return all_passed
 
 
 def main() -> int:
     """Run all validation checks."""
-    results: list[CheckResult] = []
-
-    # Core requirements
-    results.append(check_python_version())
-    results.append(check_uv_installed())
-
     # Required packages
     required_packages = [
         ("jupyterlab", "4.4.1"),
@@ -223,15 +268,32 @@ def main() -> int:
         ("datalayer_pycrdt", "0.12.17"),
     ]
 
-    for package, version in required_packages:
-        results.append(check_package_installed(package, version))
+    # Subprocess-backed checks block on fork/exec and pipe I/O, not CPU, so
+    # running them in threads overlaps their wall-clock time; executor.map
+    # preserves their order in the report.
+    slow_checks: list[Callable[[], CheckResult]] = [check_uv_installed]
+    slow_checks += [
+        partial(check_package_installed, package, version)
+        for package, version in required_packages
+    ]
+    slow_checks += [check_kernelspec, check_jupyter_running]
+
+    with ThreadPoolExecutor(max_workers=len(slow_checks)) as executor:
+        uv_result, *package_results, kernelspec_result, jupyter_result = executor.map(
+            lambda check: check(), slow_checks
+        )
+
+    # Core requirements
+    results: list[CheckResult] = [check_python_version(), uv_result]
+
+    results.extend(package_results)
 
     # Environment
     results.append(check_env_var("JUPYTER_TOKEN"))
 
     # Runtime checks
-    results.append(check_kernelspec())
-    results.append(check_jupyter_running())
+    results.append(kernelspec_result)
+    results.append(jupyter_result)
 
     all_passed = print_results(results)
     return 0 if all_passed else 1